@@ -1,8 +1,31 @@
 #!/usr/bin/env python3
+import contextlib
+import functools
+import http.client
+import http.cookiejar
 import re
-import requests
+import socket
+import sys
+import threading
+import time
+from types import MappingProxyType
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from typing import Callable, Dict, NamedTuple, Optional, List, Tuple
+from urllib.parse import urlsplit
+
+import requests
+import urllib3.exceptions
+import urllib3.util.connection
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional, stdlib json is the fallback
+    import json
+    _json_loads = json.loads
 
 GREEN = "\033[32m"
 RED = "\033[31m"
@@ -22,9 +45,228 @@ SERVICES = {
     "snapchat": "https://www.snapchat.com/add/{username}",
 }
 
+_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0 Safari/537.36"
+)
+
+# Header sets are built once and shared read-only; requests merges them into
+# a fresh dict per request, so sharing them across threads is safe.
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": _UA,
+})
+_TWITTER_HEADERS = MappingProxyType({
+    "User-Agent": _UA,
+    "Accept-Language": "en-US,en;q=0.9",
+})
+_IG_HEADERS = MappingProxyType({
+    "User-Agent": _UA,
+    "X-IG-App-ID": "936619743392459",
+})
+
+# One shared session so repeated probes to the same host reuse keep-alive
+# connections instead of paying a fresh TCP+TLS handshake every time.
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+# ...but share nothing else: cookies set by one probe must not ride along on
+# the next username's probes. A redirect chain still carries its own cookies
+# through requests' per-request jar.
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# Probes run concurrently; cap how many may hit any one host at a time.
+_PER_HOST_LIMIT = 10
+_HOST_SLOTS = {
+    host: threading.BoundedSemaphore(_PER_HOST_LIMIT)
+    for host in {urlsplit(t).hostname for t in SERVICES.values()} | {"i.instagram.com"}
+}
+
+# Size the pools to match the per-host limit so no idle connection is thrown
+# away. Probes also land on hosts we never list (redirect targets such as
+# twitter.com -> x.com, login/regional hosts), so leave room for their pools
+# too instead of letting them evict ours.
+_ADAPTER = HTTPAdapter(
+    pool_connections=2 * len(_HOST_SLOTS),
+    pool_maxsize=_PER_HOST_LIMIT,
+    max_retries=0,
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+# In-process DNS cache. Stock requests/urllib3 ask the OS resolver for every
+# new connection; with many parallel probes to the same few hosts that is a
+# lot of repeated lookups. urllib3 still gets the hostname for SNI and
+# certificate checks, only the socket connect uses the cached addresses.
+_DNS_TTL = 300.0
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[Tuple[str, ...], float]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_create_connection = urllib3.util.connection.create_connection
+
+
+def _resolve(host: str, port: int) -> Tuple[str, ...]:
+    key = (host, port)
+    now = time.monotonic()
+
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached is not None and now - cached[1] < _DNS_TTL:
+        return cached[0]
+
+    try:
+        infos = socket.getaddrinfo(
+            host, port, urllib3.util.connection.allowed_gai_family(), socket.SOCK_STREAM
+        )
+    except OSError:
+        return ()
+
+    # Keep every address, in resolver order, so connects can fall back the
+    # same way urllib3's own create_connection does.
+    addrs = tuple(dict.fromkeys(info[4][0] for info in infos))
+    if addrs:
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE[key] = (addrs, now)
+    return addrs
+
+
+def _cached_create_connection(address, *args, **kwargs):
+    host, port = address
+    addrs = _resolve(host, port)
+    if not addrs:
+        return _create_connection(address, *args, **kwargs)
+
+    err = None
+    for addr in addrs:
+        try:
+            return _create_connection((addr, port), *args, **kwargs)
+        except OSError as e:
+            err = e
+
+    # Every cached address failed; let the next connection resolve again.
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.pop((host, port), None)
+    raise err
+
+
+def _install_dns_cache():
+    # Only the tool's own entry point turns this on; importing the module
+    # leaves urllib3 untouched.
+    urllib3.util.connection.create_connection = _cached_create_connection
+
+
+def _prewarm_dns():
+    for host in _HOST_SLOTS:
+        _resolve(host, 443)
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    slot = _HOST_SLOTS.get(urlsplit(url).hostname)
+    if slot is None:
+        return _SESSION.get(url, **kwargs)
+    with slot:
+        return _SESSION.get(url, **kwargs)
+
 
-@dataclass
-class UsernameCheckResult:
+# Up to this much of a leftover body is read off so the connection can go back
+# to the keep-alive pool; if the body is longer than that it is cheaper to drop
+# the connection than to keep downloading.
+_DRAIN_LIMIT = 64 * 1024
+_CHUNK_SIZE = 16 * 1024
+
+
+def _release(resp: requests.Response):
+    # Works the same for Content-Length and chunked bodies: read until the
+    # body ends or the limit is hit, and only pool the connection in the
+    # first case.
+    raw = resp.raw
+    drained = 0
+    try:
+        while drained < _DRAIN_LIMIT:
+            chunk = raw.read(_CHUNK_SIZE, decode_content=True)
+            if not chunk:
+                break
+            drained += len(chunk)
+    except (OSError, http.client.HTTPException, urllib3.exceptions.HTTPError):
+        pass
+    else:
+        if raw.isclosed():
+            raw.release_conn()
+    resp.close()
+
+
+@contextlib.contextmanager
+def _stream(url: str, **kwargs):
+    # Like _get(stream=True), but the host slot is held until the caller is
+    # done with the body, and the connection is released with _release().
+    slot = _HOST_SLOTS.get(urlsplit(url).hostname) or contextlib.nullcontext()
+    with slot:
+        resp = _SESSION.get(url, stream=True, **kwargs)
+        try:
+            yield resp
+        finally:
+            _release(resp)
+
+
+# Every marker we look for sits near the top of the page; don't pull the rest.
+_MAX_BODY_BYTES = 128 * 1024
+
+
+def _read_head(resp: requests.Response, limit: int = _MAX_BODY_BYTES) -> bytes:
+    buf = bytearray()
+    for chunk in resp.iter_content(_CHUNK_SIZE):
+        buf += chunk
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit])
+
+
+# Twitter: error text that appears ONLY on non-existent profiles (it is also
+# the content of the error <span>, so matching the text covers both)
+_TW_NOT_EXIST = (
+    "hmm...this page doesn’t exist. try searching for something else.",
+    "hmm...this page doesn't exist. try searching for something else.",
+)
+
+# Twitter: positive markers, handle appears in title or bootstrap JSON
+_TW_POS_TEMPLATES = (
+    "(@{h}) / x",              # <title>… (@cristiano) / X</title>
+    "(@{h}) / twitter",
+    '"screen_name":"{h}"',
+    '"screen_name": "{h}"',
+    "@{h} ·",                  # header line
+)
+
+# Reddit / TikTok "not found" markers, one alternation per service matched
+# case-insensitively on the raw body bytes (no decode, no lowercased copy).
+_REDDIT_NEG = re.compile(
+    rb"sorry, nobody on reddit goes by that name|page not found",
+    re.IGNORECASE,
+)
+
+_TIKTOK_NEG = re.compile(
+    b"couldn(?:'|\xe2\x80\x99)t find this account"
+    b"|account not found"
+    b"|this account could not be found",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _twitter_scanner(handle: str) -> "re.Pattern[bytes]":
+    # All markers in one alternation so the page is scanned a single time;
+    # the named group tells us which kind of marker matched. It runs over the
+    # raw body bytes, with IGNORECASE standing in for lowercasing the page.
+    positive_markers = tuple(t.format(h=handle).encode() for t in _TW_POS_TEMPLATES)
+    not_exist = tuple(t.encode() for t in _TW_NOT_EXIST)
+    return re.compile(
+        b"(?P<missing>" + b"|".join(map(re.escape, not_exist)) + b")"
+        b"|(?P<suspended>account suspended)"
+        b"|(?P<found>" + b"|".join(map(re.escape, positive_markers)) + b")",
+        re.IGNORECASE,
+    )
+
+
+class UsernameCheckResult(NamedTuple):
     service: str
     username: str
     url: str
@@ -33,185 +275,236 @@ class UsernameCheckResult:
     error: Optional[str]
 
 
+@dataclass(frozen=True)
+class ServiceConfig:
+    neg_regex: Optional["re.Pattern[bytes]"] = None
+
+
+# Recent probe results, so re-scanning the same usernames in one session
+# doesn't hit the network again. Only definitive answers are kept.
+_RESULT_TTL = 600.0
+_RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE: Dict[Tuple[str, str], Tuple[Tuple[bool, Optional[int], Optional[str]], float]] = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def clear_cache():
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
 def check_profile(service: str, username: str, url: str, timeout: float = 8.0):
-    uname = username.lower()
+    key = (service, username)
+    now = time.monotonic()
+
+    with _RESULT_CACHE_LOCK:
+        cached = _RESULT_CACHE.get(key)
+    if cached is not None and now - cached[1] < _RESULT_TTL:
+        return cached[0]
+
+    result = _probe_profile(service, username, url, timeout)
+    if result[2] is None:
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE.pop(key, None)
+            if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+                _prune_results(now)
+            _RESULT_CACHE[key] = (result, now)
+    return result
+
+
+def _prune_results(now: float):
+    # Caller holds _RESULT_CACHE_LOCK. Drop everything expired; if the cache
+    # is still full, evict the oldest insertions until there is room.
+    for key in [k for k, (_, ts) in _RESULT_CACHE.items() if now - ts >= _RESULT_TTL]:
+        del _RESULT_CACHE[key]
+    while len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+
+
+# INSTAGRAM – JSON API (authoritative)
+def _check_instagram(username: str, url: str, timeout: float, config: ServiceConfig):
+    api_url = (
+        "https://i.instagram.com/api/v1/users/web_profile_info/"
+        f"?username={username}"
+    )
+    try:
+        resp = _get(api_url, headers=_IG_HEADERS, timeout=timeout)
+        status = resp.status_code
 
-    # INSTAGRAM – JSON API (authoritative)
-    if service == "instagram":
-        api_url = (
-            "https://i.instagram.com/api/v1/users/web_profile_info/"
-            f"?username={username}"
-        )
-        ig_headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "X-IG-App-ID": "936619743392459",
-        }
-        try:
-            resp = requests.get(api_url, headers=ig_headers, timeout=timeout)
-            status = resp.status_code
+        if status == 200:
+            try:
+                data = _json_loads(resp.content)
+            except ValueError:
+                return False, status, "invalid_json"
+            user_obj = data.get("data") and data["data"].get("user")
+            return (True if user_obj else False), status, None
 
-            if status == 200:
-                try:
-                    data = resp.json()
-                except ValueError:
-                    return False, status, "invalid_json"
-                user_obj = data.get("data", {}).get("user")
-                return (True if user_obj else False), status, None
+        if status == 404:
+            return False, status, None
 
-            if status == 404:
-                return False, status, None
+        return False, status, "uncertain"
+    except requests.RequestException as e:
+        return False, None, str(e)
 
-            return False, status, "uncertain"
-        except requests.RequestException as e:
-            return False, None, str(e)
-
-    # TWITTER / X – HTML inspection (conservative)
-    if service == "twitter":
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-        }
 
-        # Error span / text that appears ONLY on non-existent profiles
-        not_exist_texts = [
-            "hmm...this page doesn’t exist. try searching for something else.",
-            "hmm...this page doesn't exist. try searching for something else.",
-        ]
-        not_exist_span = (
-            '<span class="css-1jxf684 r-bcqeeo r-1ttztb7 r-qvutc0 r-poiln3">'
-            "Hmm...this page doesn’t exist. Try searching for something else."
-            "</span>"
-        )
+# TWITTER / X – HTML inspection (conservative)
+def _check_twitter(username: str, url: str, timeout: float, config: ServiceConfig):
+    scanner = _twitter_scanner(username.lower())
 
-        try:
-            resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    try:
+        with _stream(url, headers=_TWITTER_HEADERS, timeout=timeout, allow_redirects=True) as resp:
             status = resp.status_code
-            html = resp.text
-            html_lower = html.lower()
-            final_url = resp.url.lower()
-
-            # 1) Explicit "page doesn't exist" markers → definitely NOT found
-            if not_exist_span in html:
-                return False, status, None
-            for t in not_exist_texts:
-                if t in html_lower:
-                    return False, status, None
 
-            # 2) HTTP 404 → not found
+            # 1) Decide on status alone when we can; the body is not inspected
+            #    (_stream() drains a short one so the connection is reused)
             if status == 404:
                 return False, status, None
+            if status >= 500:
+                return False, status, "uncertain"
 
-            # 3) Suspended accounts (URL or text) → username exists
-            if "account suspended" in html_lower or "/account/suspended" in final_url:
-                return True, status, None
+            raw = _read_head(resp)
+            final_url = resp.url.lower()
 
-            # 4) Positive markers: handle appears in title or bootstrap JSON
-            handle = uname
-            positive_markers = [
-                f"(@{handle}) / x",              # <title>… (@cristiano) / X</title>
-                f"(@{handle}) / twitter",
-                f'"screen_name":"{handle}"',
-                f'"screen_name": "{handle}"',
-                f'@{handle} ·',                  # header line
-            ]
-            for m in positive_markers:
-                if m in html_lower:
-                    return True, status, None
-
-            # 5) If none of the above triggered:
-            #    be conservative → treat as NOT FOUND rather than saying it exists.
-            return False, status, "uncertain"
+        hits = set()
+        for m in scanner.finditer(raw):
+            hits.add(m.lastgroup)
+            if m.lastgroup == "missing":
+                break
 
-        except requests.RequestException as e:
-            return False, None, str(e)
+        # 2) Explicit "page doesn't exist" markers → definitely NOT found
+        if "missing" in hits:
+            return False, status, None
 
-    # OTHER SERVICES – HTML / status heuristics
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        )
-    }
+        # 3) Suspended accounts (URL or text) → username exists
+        if "suspended" in hits or "/account/suspended" in final_url:
+            return True, status, None
 
-    try:
-        resp = requests.get(url, headers=headers, allow_redirects=True, timeout=timeout)
-        status = resp.status_code
-        text_lower = resp.text.lower()
+        # 4) Positive markers
+        if "found" in hits:
+            return True, status, None
 
-        if service == "facebook":
-            if status == 200:
-                return True, status, None
-            if status == 404:
-                return False, status, None
-            return False, status, "uncertain"
+        # 5) If none of the above triggered:
+        #    be conservative → treat as NOT FOUND rather than saying it exists.
+        return False, status, "uncertain"
 
-        if service == "reddit":
-            if (
-                "sorry, nobody on reddit goes by that name" in text_lower
-                or "page not found" in text_lower
-            ):
-                return False, status, None
-            if status == 200:
-                return True, status, None
+    except requests.RequestException as e:
+        return False, None, str(e)
+
+
+# OTHER SERVICES – HTML / status heuristics
+def _check_generic_html(username: str, url: str, timeout: float, config: ServiceConfig):
+    try:
+        with _stream(url, allow_redirects=True, timeout=timeout) as resp:
+            status = resp.status_code
+
+            # Decide on status alone when we can; the body is not inspected.
+            # Status-only services (no neg_regex) never look at it either.
+            # Whatever is left unread is drained by _stream() on exit (up to
+            # _DRAIN_LIMIT) so the connection stays in the keep-alive pool.
             if status == 404:
                 return False, status, None
-            return False, status, "uncertain"
+            if status >= 500:
+                return False, status, "uncertain"
 
-        if service == "tiktok":
-            if (
-                "couldn't find this account" in text_lower
-                or "couldn’t find this account" in text_lower
-                or "account not found" in text_lower
-                or "this account could not be found" in text_lower
-            ):
+            # Only services with a "not found" marker inspect the body
+            if config.neg_regex is not None and config.neg_regex.search(_read_head(resp)):
                 return False, status, None
             if status == 200:
                 return True, status, None
-            if status == 404:
-                return False, status, None
             return False, status, "uncertain"
 
-        if status == 200:
-            return True, status, None
-        if status == 404:
-            return False, status, None
-        return False, status, "uncertain"
-
     except requests.RequestException as e:
         return False, None, str(e)
 
 
+_DEFAULT_CONFIG = ServiceConfig()
+
+_CONFIG = {
+    "facebook": ServiceConfig(),
+    "reddit": ServiceConfig(neg_regex=_REDDIT_NEG),
+    "tiktok": ServiceConfig(neg_regex=_TIKTOK_NEG),
+}
+
+_HANDLERS = {
+    "instagram": _check_instagram,
+    "twitter": _check_twitter,
+}
+
+
+def _probe_profile(service: str, username: str, url: str, timeout: float):
+    handler = _HANDLERS.get(service, _check_generic_html)
+    return handler(username, url, timeout, _CONFIG.get(service, _DEFAULT_CONFIG))
+
+
+_MAX_WORKERS = 32
+
+# Each template has exactly one "{username}", so a URL is prefix + name + suffix.
+_SERVICE_PARTS = {
+    service: tuple(template.split("{username}"))
+    for service, template in SERVICES.items()
+}
+
+
+def check_usernames(
+    usernames,
+    on_complete: Optional[Callable[[str, Dict[str, UsernameCheckResult]], None]] = None,
+) -> Dict[str, Dict[str, UsernameCheckResult]]:
+    # Every (variant, service) probe is independent, so run them all at once.
+    jobs = [
+        (username, service, prefix + username + suffix)
+        for username in usernames
+        for service, (prefix, suffix) in _SERVICE_PARTS.items()
+    ]
+    # Pre-seed the inner dicts so results keep SERVICES order regardless of
+    # which probe finishes first.
+    all_results: Dict[str, Dict[str, UsernameCheckResult]] = {
+        username: dict.fromkeys(SERVICES) for username in usernames
+    }
+    if not jobs:
+        return all_results
+
+    # on_complete fires for a username as soon as its last service reports in
+    pending = Counter(username for username, _, _ in jobs)
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(jobs))) as ex:
+        futures = {
+            ex.submit(check_profile, service, username, url): (username, service, url)
+            for username, service, url in jobs
+        }
+
+        for future in as_completed(futures):
+            username, service, url = futures[future]
+            exists, status, error = future.result()
+
+            all_results[username][service] = UsernameCheckResult(
+                service=service,
+                username=username,
+                url=url,
+                exists=exists,
+                http_status=status,
+                error=error,
+            )
+
+            pending[username] -= 1
+            if on_complete is not None and not pending[username]:
+                on_complete(username, all_results[username])
+
+    return all_results
+
+
 def check_username_single(username: str) -> Dict[str, UsernameCheckResult]:
-    results: Dict[str, UsernameCheckResult] = {}
-
-    for service, template in SERVICES.items():
-        url = template.format(username=username)
-        exists, status, error = check_profile(service, username, url)
-
-        results[service] = UsernameCheckResult(
-            service=service,
-            username=username,
-            url=url,
-            exists=exists,
-            http_status=status,
-            error=error,
-        )
+    return check_usernames([username])[username]
 
-    return results
 
+# Fold every separator onto "." so one split handles all of them.
+_SEP_TRANS = str.maketrans("_-", "..")
 
-def generate_variants(base_username: str) -> List[str]:
-    if re.search(r"[._-]", base_username):
-        parts = re.split(r"[._-]", base_username)
+
+@functools.lru_cache(maxsize=256)
+def generate_variants(base_username: str) -> Tuple[str, ...]:
+    normalized = base_username.translate(_SEP_TRANS)
+    if "." in normalized:
+        parts = normalized.split(".")
     else:
         if len(base_username) >= 4:
             mid = len(base_username) // 2
@@ -233,33 +526,43 @@ def generate_variants(base_username: str) -> List[str]:
             seen.add(c)
             variants.append(c)
 
-    return variants
+    return tuple(variants)
+
 
+# Display names, padded for the results table once rather than per line.
+_PRETTY = {s: f"{s.replace('_', ' ').title():15}" for s in SERVICES}
 
-def print_results(base_username: str, all_results: Dict[str, Dict[str, UsernameCheckResult]]):
-    print("\n======================================")
-    print(f"     OSINT RESULTS FOR BASE: {base_username}")
-    print("======================================\n")
+_RULE = "======================================\n"
+_FOOTER = "Scan complete.\n\n"
 
-    for variant, results in all_results.items():
-        print(f"--- Username variant: {variant} ---")
-        any_found = False
 
-        for service, r in results.items():
-            pretty_name = service.replace("_", " ").title()
+def _format_header(base_username: str) -> str:
+    return f"\n{_RULE}     OSINT RESULTS FOR BASE: {base_username}\n{_RULE}\n"
 
-            if r.exists:
-                any_found = True
-                print(f"{GREEN}[+] {pretty_name:15} FOUND  -> {r.url}{RESET}")
-            else:
-                print(f"{RED}[-] {pretty_name:15} not found{RESET}")
 
-        if not any_found:
-            print(f"{RED}No profiles found for this variant.{RESET}")
+def _format_variant(variant: str, results: Dict[str, UsernameCheckResult]) -> str:
+    buf = [f"--- Username variant: {variant} ---\n"]
+    any_found = False
 
-        print()
+    for service, r in results.items():
+        pretty_name = _PRETTY[service]
+
+        if r.exists:
+            any_found = True
+            buf.append(f"{GREEN}[+] {pretty_name} FOUND  -> {r.url}{RESET}\n")
+        else:
+            buf.append(f"{RED}[-] {pretty_name} not found{RESET}\n")
 
-    print("Scan complete.\n")
+    if not any_found:
+        buf.append(f"{RED}No profiles found for this variant.{RESET}\n")
+
+    buf.append("\n")
+    return "".join(buf)
+
+
+def _write_variant(variant: str, results: Dict[str, UsernameCheckResult]):
+    sys.stdout.write(_format_variant(variant, results))
+    sys.stdout.flush()
 
 
 def run_scan() -> bool:
@@ -271,27 +574,32 @@ def run_scan() -> bool:
 
     print("\nProcessing scan, please wait...\n")
 
-    variants = generate_variants(base_username)
-    all_results = {}
-
-    for v in variants:
-        all_results[v] = check_username_single(v)
-
-    print_results(base_username, all_results)
+    # Each variant's block is printed as soon as all of its services are done
+    sys.stdout.write(_format_header(base_username))
+    check_usernames(generate_variants(base_username), on_complete=_write_variant)
+    sys.stdout.write(_FOOTER)
+    sys.stdout.flush()
 
     while True:
-        again = input("Do you want to scan another username? (y/n): ").strip().lower()
+        again = input(
+            "Do you want to scan another username? (y/n, c = clear cache and scan again): "
+        ).strip().lower()
         if again in ("y", "yes"):
             return True
         if again in ("n", "no", ""):
             return False
-        print("Please answer with 'y' or 'n'.")
+        if again in ("c", "clear"):
+            clear_cache()
+            print("Cache cleared.")
+            return True
+        print("Please answer with 'y', 'n' or 'c'.")
 
 
-def main():
-    print(
-        YELLOW
-        + r"""
+# Rendered once at import; main() writes it straight to stdout's byte stream,
+# encoded once per output encoding by _banner_bytes().
+_BANNER = (
+    YELLOW
+    + r"""
 ██╗  ██╗ ██████╗  ██████╗ ██╗███╗   ██╗████████╗███████╗██████╗ 
 ██║ ██╔╝██╔═══██╗██╔════╝ ██║████╗  ██║╚══██╔══╝██╔════╝██╔══██╗
 █████╔╝ ██║   ██║██████╗  ██║██╔██╗ ██║   ██║   █████╗  ██████╔╝
@@ -299,15 +607,42 @@ def main():
 ██║  ██╗╚██████╔╝██████╔╝ ██║██║ ╚████║   ██║   ███████╗██║  ██║
 ╚═╝  ╚═╝ ╚═════╝ ╚═════╝  ╚═╝╚═╝  ╚═══╝   ╚═╝   ╚══════╝╚═╝  ╚═╝
 """
-        + RESET
-    )
+    + RESET
+    + "\n"
+    + "         KOSINTER - OSINT Username Enumeration Tool.\n"
+    "\n"
+    "         Join us on Discord at our KOSINT COMMUNITY:\n"
+    "               https://discord.gg/6mHpwwnP\n\n"
+    "\n"
+)
 
-    print(
-        "         KOSINTER - OSINT Username Enumeration Tool.\n"
-        "\n"
-        "         Join us on Discord at our KOSINT COMMUNITY:\n"
-        "               https://discord.gg/6mHpwwnP\n\n"
-    )
+
+@functools.lru_cache(maxsize=None)
+def _banner_bytes(encoding: str, errors: str) -> bytes:
+    return _BANNER.encode(encoding, errors)
+
+
+def _write_banner():
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout was replaced by a text-only stream (e.g. io.StringIO)
+        sys.stdout.write(_BANNER)
+        return
+
+    # Encode the way the text layer would, then flush pending text first so
+    # the raw write doesn't jump ahead of it.
+    data = _banner_bytes(sys.stdout.encoding or "utf-8", sys.stdout.errors or "strict")
+    sys.stdout.flush()
+    out.write(data)
+    out.flush()
+
+
+def main():
+    _install_dns_cache()
+    # Resolve every service host while the user is typing the first username.
+    threading.Thread(target=_prewarm_dns, daemon=True).start()
+
+    _write_banner()
 
     while True:
         if not run_scan():